@@ -2,11 +2,24 @@
 
 import argparse
 import collections
-import copy
+import functools
 import jsmin
 import json
+import math
+import multiprocessing
 import os
-from typing import Any, Dict, Iterable, List, Optional, OrderedDict
+import re
+import sys
+from typing import Any, Counter, Dict, FrozenSet, Iterable, Optional, Tuple
+
+try:
+    import ijson  # optional: incremental parsing of very large files
+except ImportError:
+    ijson = None
+try:
+    import orjson  # optional: considerably faster (de)serialization of large files
+except ImportError:
+    orjson = None
 
 
 # Default settings used if not set otherwise via the Command Line Interface
@@ -14,95 +27,226 @@ DEFAULT_SEARCH_KEYS: Iterable[str] = ("name", "fromDict", "sourceName")
 DEFAULT_TARGET_KEYS: Iterable[str] = ("name",)
 DEFAULT_IGNORED_PATHS: Iterable[str] = ()
 
+# Integers that may not fit into 64 bits, which `orjson` would read as floats
+_LONG_INTEGER = re.compile(r"\d{19,}")
+
+# Files larger than this (in bytes) are parsed incrementally if `ijson` is available
+STREAMING_THRESHOLD: int = 100 * 1024**2
+
+# Pruning settings of a worker process, see `_init_pruning_worker`
+_worker_settings: Tuple[Any, ...] = ()
+
+
+def _intern_pairs(pairs: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Build dict from parsed `pairs`, interning its keys and string values."""
+    return {sys.intern(k): sys.intern(v) if type(v) is str else v for k, v in pairs}
 
-def get_ordered_dict_from_file(fn: str) -> OrderedDict:
-    """Read file content (e.g. a nested object) into an OrderedDict."""
-    with open(os.path.abspath(fn), "r") as read_file:
-        as_str = jsmin.jsmin(read_file.read())
-        return collections.OrderedDict(json.loads(as_str))
+
+def get_ordered_dict_from_file(fn: str) -> Any:
+    """Read file content (e.g. a nested object) as JSON.
+
+    Objects are returned as (insertion-ordered) dicts, but the file may just as well
+    contain e.g. an array or a single scalar value.
+    """
+    path = os.path.abspath(fn)
+    if ijson is not None and os.path.getsize(path) > STREAMING_THRESHOLD:
+        with open(path, "rb") as read_file:
+            while (first := read_file.read(1)).isspace():
+                pass
+            read_file.seek(0)
+            try:
+                if first == b"{":
+                    return dict(ijson.kvitems(read_file, "", use_float=True))
+                return next(ijson.items(read_file, "", use_float=True))
+            except ijson.JSONError:
+                pass  # e.g. due to comments: read and minify the whole file instead
+    with open(path, "r") as read_file:
+        as_str = read_file.read()
+    if "//" in as_str or "/*" in as_str:
+        as_str = jsmin.jsmin(as_str)  # may contain comments: strip them
+    if orjson is not None and not _LONG_INTEGER.search(as_str):
+        try:
+            return orjson.loads(as_str)  # caches (i.e. shares) repeated keys itself
+        except orjson.JSONDecodeError:
+            pass  # e.g. due to NaN or Infinity, which only `json` accepts
+    # share repeated keys and string values between all parsed objects
+    return json.loads(as_str, object_pairs_hook=_intern_pairs)
+
+
+def _contains_non_finite_float(obj: Any) -> bool:
+    """Check whether nested `obj` contains NaN, Infinity or -Infinity anywhere."""
+    stack = [obj]
+    container_types = _CONTAINER_TYPES
+    while stack:
+        node = stack.pop()
+        kind = container_types[type(node)]
+        if kind is dict:
+            stack.extend(node.values())
+        elif kind is list:
+            stack.extend(node)
+        elif type(node) is float and not math.isfinite(node):
+            return True
+    return False
 
 
 def write_dict_to_json(dict_: dict, fn: str, sort_keys: bool = False) -> None:
-    """Write `dict` as JSON to specified file."""
+    """Write `dict` as JSON to specified file.
+
+    If `orjson` is available, it is used for speed unless `dict_` contains values it
+    cannot write like `json` does: NaN/Infinity (written as `null` by `orjson`) and
+    integers wider than 64 bits. Unlike `json`, it writes non-ASCII characters as
+    UTF-8 instead of escaping them and may format numbers differently.
+    """
+    if orjson is not None and not _contains_non_finite_float(dict_):
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            as_bytes = orjson.dumps(dict_, option=option)
+        except TypeError:
+            pass  # e.g. due to integers wider than 64 bits: use `json` instead
+        else:
+            with open(os.path.abspath(fn), "wb") as write_file:
+                write_file.write(as_bytes)
+            return
     with open(os.path.abspath(fn), "w") as write_file:
         json.dump(dict_, write_file, sort_keys=sort_keys, indent=2)
 
 
-def get_values_for_keys(
-    obj: Any, keys: Iterable[Any], values: Optional[set] = None
-) -> set:
-    """Get all values for `keys` found in nested `obj`."""
-    if not values:
-        values = set()
-
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k in keys:
-                values.add(v)
-            else:
-                values = get_values_for_keys(obj=v, keys=keys, values=values)
-    elif isinstance(obj, list):
-        for element in obj:
-            values = get_values_for_keys(obj=element, keys=keys, values=values)
-
-    return values
+class _ContainerTypes(dict):
+    """Map types of nodes to `dict`, `list` or `None` (if they are no container).
 
+    Exact type lookups are cheaper than `isinstance` chains; subclasses such as
+    `OrderedDict` are resolved once on their first lookup.
+    """
 
-def get_substr_frequency(string: str, substrings: Iterable[str]) -> Dict[str, int]:
-    """Get dictionary with frequencies (vals) of substrings (keys) in given string."""
-    return {s: string.count(s) for s in substrings}
+    def __missing__(self, cls):
+        kind = self[cls] = next((t for t in (dict, list) if issubclass(cls, t)), None)
+        return kind
 
 
-def summed_frequencies(freq: Dict[Any, int]):
-    """Get total sum of frequencies in given frequency dict."""
-    return sum(freq.values())
+_CONTAINER_TYPES = _ContainerTypes({dict: dict, list: list, str: None, int: None})
 
 
-def _prune_dict(dict_, on_keys, for_values, ignore_paths, path):
-    """Type-specific helper for `prune_obj`."""
-    pruned = {}
-    for k, v in dict_.items():
-        if k in on_keys and v in for_values:
-            # current `obj` matches pruning criteria: do *not* return it
-            return None
-        elif v:
-            # recursively prune current key's value
-            path.append(k)
-            pruned_v = prune_obj(
-                obj=v,
-                on_keys=on_keys,
-                for_values=for_values,
-                ignore_paths=ignore_paths,
-                path=path,
-            )
-            if pruned_v:
-                pruned[k] = pruned_v
-            path.pop()
-        else:
-            # catch and return empty value; it may be meaningful
-            pruned[k] = v
-    return pruned
+def _matches(dict_, on_keys, for_values):
+    """Check whether any key in `on_keys` has a value in `for_values` in `dict_`.
 
+    Values that are containers never match (they cannot be orphaned identifiers).
+    """
+    for k in on_keys:
+        if k in dict_:
+            v = dict_[k]
+            if _CONTAINER_TYPES[type(v)] is None and v in for_values:
+                return True
+    return False
+
+
+def count_values(obj: Any, keys: Iterable[Any], counter: Counter) -> Counter:
+    """Tally all values for `keys` found in nested `obj` into `counter`."""
+    stack = [obj]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    container_types = _CONTAINER_TYPES
+    while stack:
+        node = pop()
+        kind = container_types[type(node)]
+        if kind is dict:
+            for k, v in node.items():
+                if k in keys:
+                    counter[v] += 1
+                else:
+                    push(v)
+        elif kind is list:
+            extend(node)
+
+    return counter
+
+
+def count_search_values(obj: Any, keys: Iterable[Any]) -> Counter:
+    """Get frequencies (vals) of all values for `keys` (keys) found in nested `obj`."""
+    return count_values(obj, keys, collections.Counter())
+
+
+@functools.lru_cache(maxsize=32)
+def _path_prefixes(paths: FrozenSet[str]) -> FrozenSet[str]:
+    """Get all dot-separated prefixes of `paths`, including `paths` themselves."""
+    prefixes = set()
+    for path in paths:
+        parts = path.split(".")
+        prefixes.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return frozenset(prefixes)
+
+
+def _pruning_starter(on_keys, for_values, ignore_paths, search_keys, removed):
+    """Helper for `prune_obj`: bind the pruning settings into a per-node function.
+
+    The returned function inspects a node (given its path) before its children are
+    visited. It returns the (still empty) pruned container and an iterator over the
+    children that remain to be visited, or the final result and `None` if there are
+    none.
+    """
 
-def _prune_list(list_, on_keys, for_values, ignore_paths, path):
-    """Type-specific helper for `prune_obj`."""
-    pruned = []
-    for element in list_:
-        if element:
-            # recursively prune current element
-            pruned_e = prune_obj(
-                obj=element,
-                on_keys=on_keys,
-                for_values=for_values,
-                ignore_paths=ignore_paths,
-                path=path
-            )
-            if pruned_e:
-                pruned.append(pruned_e)
+    def start(node, path_str):
+        if ignore_paths and path_str in ignore_paths:
+            return node, None  # current path is 'blacklisted': won't inspect it
+        kind = _CONTAINER_TYPES[type(node)]
+        if kind is dict:
+            if not on_keys.isdisjoint(node) and _matches(node, on_keys, for_values):
+                # current `node` matches pruning criteria: do *not* return it
+                if removed is not None:
+                    count_values(node, search_keys, removed)
+                return None, None
+            return {}, iter(node.items())
+        if kind is list:
+            return [], enumerate(node)
+        return node, None
+
+    return start
+
+
+def _prune_obj_fast(obj, on_keys, for_values, search_keys, removed):
+    """Variant of `prune_obj` without any path bookkeeping, for no `ignore_paths`."""
+    start = _pruning_starter(on_keys, for_values, None, search_keys, removed)
+    pruned, children = start(obj, None)
+    if children is None:
+        return pruned
+
+    # same traversal as in `prune_obj`, but frames omit the path and the per-node
+    # checks of `_pruning_starter` are inlined
+    stack = [(pruned, children, None)]
+    push, pop = stack.append, stack.pop
+    container_types = _CONTAINER_TYPES
+    while True:
+        pruned, children, key = stack[-1]
+        is_dict = type(pruned) is dict
+        for k, v in children:
+            kind = container_types[type(v)]
+            if kind is dict and v:
+                if not on_keys.isdisjoint(v) and _matches(v, on_keys, for_values):
+                    # current `v` matches pruning criteria: drop it
+                    if removed is not None:
+                        count_values(v, search_keys, removed)
+                    continue
+                push(({}, iter(v.items()), k))
+                break
+            if kind is list and v:
+                push(([], enumerate(v), k))
+                break
+            # scalars and empty containers are kept as they are
+            if is_dict:
+                pruned[k] = v
+            else:
+                pruned.append(v)
         else:
-            # catch and return empty element; it may be meaningful
-            pruned.append(element)
-    return pruned
+            pop()
+            if not stack:
+                return pruned
+            parent = stack[-1][0]
+            if not pruned:
+                continue
+            if type(parent) is dict:
+                parent[key] = pruned
+            else:
+                parent.append(pruned)
 
 
 def prune_obj(
@@ -110,32 +254,271 @@ def prune_obj(
     on_keys: Iterable[Any],
     for_values: Iterable[Any],
     ignore_paths: Optional[Iterable[str]] = None,
-    path: Optional[List[Any]] = None,
+    path_str: Optional[str] = None,
+    search_keys: Iterable[Any] = (),
+    removed_counter: Optional[Counter] = None,
 ) -> Any:
-    """Remove elements from nested `obj` where given keys match specified values."""
-    if not path:
-        path = []
-    if ignore_paths and path and ".".join(path) in ignore_paths:
-        return obj  # current path is 'blacklisted': won't inspect it further/deeper
-    if isinstance(obj, dict):
-        pruned = _prune_dict(
-            dict_=obj,
-            on_keys=on_keys,
-            for_values=for_values,
-            ignore_paths=ignore_paths,
-            path=path,
-        )
-    elif isinstance(obj, list):
-        pruned = _prune_list(
-            list_=obj,
-            on_keys=on_keys,
-            for_values=for_values,
+    """Remove elements from nested `obj` where given keys match specified values.
+
+    `path_str` is the dot-separated path of `obj` itself (`None` for the root),
+    against which the paths in `ignore_paths` are matched. If `removed_counter` is
+    given, the values for `search_keys` found in all removed elements are tallied
+    into it.
+    """
+    on_keys = frozenset(on_keys)
+    for_values = frozenset(for_values)
+    if not ignore_paths:
+        return _prune_obj_fast(obj, on_keys, for_values, search_keys, removed_counter)
+
+    start = _pruning_starter(
+        on_keys, for_values, ignore_paths, search_keys, removed_counter
+    )
+    pruned, children = start(obj, path_str)
+    if children is None:
+        return pruned
+
+    # depth-first traversal without recursion; each frame holds a pruned container,
+    # the iterator over its remaining children, its path (only as long as ignored
+    # paths may be found below it, `False` otherwise) and its key in the parent
+    prefixes = _path_prefixes(frozenset(ignore_paths))
+    stack = [(pruned, children, path_str, None)]
+    container_types = _CONTAINER_TYPES
+    while True:
+        pruned, children, path_str, key = stack[-1]
+        is_dict = type(pruned) is dict
+        for k, v in children:
+            if container_types[type(v)] is not None and v:
+                # prune non-empty container, descending into it unless it is dropped
+                child_path = path_str
+                if is_dict and path_str is not False:
+                    child_path = k if path_str is None else f"{path_str}.{k}"
+                    if child_path not in prefixes:
+                        child_path = False  # no ignored path at or below it
+                v, grandchildren = start(v, child_path)
+                if grandchildren is not None:
+                    stack.append((v, grandchildren, child_path, k))
+                    break
+                if not v:
+                    continue
+            # else: keep scalar or empty container; it may be meaningful
+            if is_dict:
+                pruned[k] = v
+            else:
+                pruned.append(v)
+        else:
+            # all children visited: hand the pruned container over to its parent
+            stack.pop()
+            if not stack:
+                return pruned
+            parent = stack[-1][0]
+            if not pruned:
+                continue
+            if type(parent) is dict:
+                parent[key] = pruned
+            else:
+                parent.append(pruned)
+
+
+def _index_obj(obj, search_keys, clean_keys, ignore_paths):
+    """Helper for `clean_obj`: index nested `obj` in a single traversal.
+
+    Returns the frequencies of all values for `search_keys` in `obj` and, per value
+    for any key in `clean_keys`, the items (dicts) having it. Items in and below
+    `ignore_paths` are counted but not indexed. Returns `None` if any non-empty
+    container occurs more than once in `obj` (i.e. if `obj` is no tree), and raises
+    `ValueError` if a container even contains itself.
+    """
+    freq = collections.Counter()
+    items = collections.defaultdict(list)
+    seen = set()
+    container_types = _CONTAINER_TYPES
+
+    if not ignore_paths:
+        # same traversal as below, but without any path bookkeeping
+        stack = [obj]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+        while stack:
+            node = pop()
+            kind = container_types[type(node)]
+            if kind is None or not node:
+                continue
+            if id(node) in seen:
+                _check_acyclic(obj)
+                return None
+            seen.add(id(node))
+            if kind is dict:
+                for k in clean_keys:
+                    if k in node and container_types[type(node[k])] is None:
+                        items[node[k]].append(node)
+                for k, v in node.items():
+                    if k in search_keys:
+                        freq[v] += 1
+                    else:
+                        push(v)
+            else:
+                extend(node)
+        return freq, items
+
+    # paths are only tracked as long as ignored paths may be found below them;
+    # items in and below ignored paths are only counted, not indexed
+    prefixes = _path_prefixes(ignore_paths)
+    stack = [(obj, None, True)]
+    while stack:
+        node, path_str, indexed = stack.pop()
+        kind = container_types[type(node)]
+        if kind is None or not node:
+            continue
+        if id(node) in seen:
+            _check_acyclic(obj)
+            return None
+        seen.add(id(node))
+        if kind is dict:
+            if indexed:
+                for k in clean_keys:
+                    if k in node and container_types[type(node[k])] is None:
+                        items[node[k]].append(node)
+            for k, v in node.items():
+                if k in search_keys:
+                    freq[v] += 1
+                    continue
+                child_path, child_indexed = False, indexed
+                if path_str is not False:
+                    child_path = k if path_str is None else f"{path_str}.{k}"
+                    if child_path not in prefixes:
+                        child_path = False
+                    elif child_path in ignore_paths:
+                        # current path is 'blacklisted': only count its values
+                        child_path, child_indexed = False, False
+                stack.append((v, child_path, child_indexed))
+        else:
+            for element in node:
+                stack.append((element, path_str, indexed))
+
+    return freq, items
+
+
+def _check_acyclic(obj):
+    """Helper for `clean_obj`: raise `ValueError` if any container contains itself.
+
+    Containers that merely occur in several places within `obj` are fine.
+    """
+    on_path = set()  # ids of the containers currently being descended into
+    done = set()  # ids of the containers fully checked already
+    stack = [(obj, False)]
+    container_types = _CONTAINER_TYPES
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            on_path.remove(id(node))
+            done.add(id(node))
+            continue
+        kind = container_types[type(node)]
+        if kind is None or id(node) in done:
+            continue
+        if id(node) in on_path:
+            raise ValueError("circular reference")
+        on_path.add(id(node))
+        stack.append((node, True))
+        for child in node.values() if kind is dict else node:
+            stack.append((child, False))
+
+
+def _clean_obj_in_rounds(obj, search_keys, clean_keys, ignore_paths):
+    """Helper for `clean_obj`: prune `obj` once per round of orphaned values.
+
+    Unlike going by the index of `_index_obj`, this also counts correctly if a
+    container occurs in several places within `obj`.
+    """
+    freq = count_search_values(obj=obj, keys=search_keys)
+
+    orphaned_values = frozenset(k for k, f in freq.items() if f == 1)
+    while orphaned_values:
+        removed = collections.Counter()
+        obj = prune_obj(
+            obj=obj,
+            on_keys=clean_keys,
+            for_values=orphaned_values,
             ignore_paths=ignore_paths,
-            path=path
+            search_keys=search_keys,
+            removed_counter=removed,
         )
-    else:
-        return obj
+        freq.subtract(removed)
+        # items with previously orphaned values are gone by now: only values that
+        # lost references in this pass may have become orphaned
+        orphaned_values = frozenset(k for k in removed if freq[k] == 1)
+
+    return obj
 
+
+def _drop_item(item, search_keys, removed, dropped):
+    """Helper for `clean_obj`: account for the removal of indexed `item`.
+
+    Tallies the values for `search_keys` found in `item` into `removed` and adds the
+    ids of all containers in it to `dropped`, skipping those already in there.
+    """
+    stack = [item]
+    container_types = _CONTAINER_TYPES
+    while stack:
+        node = stack.pop()
+        kind = container_types[type(node)]
+        if kind is None or id(node) in dropped:
+            continue
+        dropped.add(id(node))
+        if kind is dict:
+            for k, v in node.items():
+                if k in search_keys:
+                    removed[v] += 1
+                else:
+                    stack.append(v)
+        else:
+            stack.extend(node)
+
+
+def _init_pruning_worker(on_keys, for_values, ignore_paths):
+    """Helper for `_prune_top_level_items`: keep the pruning settings in a worker.
+
+    Called once per worker process, so that the settings (in particular, all the
+    values to prune for) are not sent along with every single item.
+    """
+    global _worker_settings
+    _worker_settings = (on_keys, for_values, ignore_paths)
+
+
+def _prune_in_worker(obj, path_str):
+    """Helper for `_prune_top_level_items`: `prune_obj` with the worker's settings."""
+    return prune_obj(obj, *_worker_settings, path_str)
+
+
+def _prune_top_level_items(dict_, on_keys, for_values, ignore_paths, processes):
+    """Helper for `clean_obj`: `prune_obj` with top-level items pruned in parallel."""
+    if not on_keys.isdisjoint(dict_) and _matches(dict_, on_keys, for_values):
+        return None  # `dict_` itself matches pruning criteria
+
+    # only non-empty containers that are not ignored may change; all other values
+    # are kept as they are (in particular, not sent to other processes)
+    to_prune = [
+        k
+        for k, v in dict_.items()
+        if _CONTAINER_TYPES[type(v)] is not None and v and k not in ignore_paths
+    ]
+    if len(to_prune) < 2:
+        # nothing to distribute: not worth starting any worker processes
+        pruned_values = [
+            prune_obj(dict_[k], on_keys, for_values, ignore_paths, k) for k in to_prune
+        ]
+    else:
+        with multiprocessing.Pool(
+            processes, _init_pruning_worker, (on_keys, for_values, ignore_paths)
+        ) as pool:
+            pruned_values = pool.starmap(
+                _prune_in_worker, [(dict_[k], k) for k in to_prune]
+            )
+    pruned = dict(dict_)
+    for k, pruned_v in zip(to_prune, pruned_values):
+        if pruned_v:
+            pruned[k] = pruned_v
+        else:
+            del pruned[k]
     return pruned
 
 
@@ -144,6 +527,7 @@ def clean_obj(
     search_keys: Iterable[Any],
     clean_keys: Iterable[Any],
     ignore_paths: Optional[Iterable[str]] = None,
+    processes: Optional[int] = None,
 ) -> Any:
     """Remove obsolete items from nested `obj`.
 
@@ -174,36 +558,67 @@ def clean_obj(
         path here must be described by the sequence of its keys, separated by a dot.
         For instance, "config.foo.bar" would prevent `config[foo][bar][<...>]` from
         being cleaned.
+    processes
+        Number of worker processes among which the top-level items of `obj` (if it
+        is a dictionary) are distributed for removing obsolete items. By default,
+        everything is done in the current process. Only worthwhile for large objects
+        with many top-level items of comparable size.
 
     Returns
     -------
-    Cleaned deep copy of `obj`.
+    Cleaned version of `obj`, which may be `obj` itself if nothing needs to be
+    removed. `obj` itself is never modified, but parts of it that are not affected
+    by cleaning (e.g. ignored paths) may be shared with the result.
 
     """
-    cleaned_obj = copy.deepcopy(obj)
-
-    matches = get_values_for_keys(obj=obj, keys=search_keys)
-
-    while True:
-        freq_before = get_substr_frequency(
-            string=json.dumps(cleaned_obj),
-            substrings=matches,
-        )
-        if orphaned_values := [k for k, f in freq_before.items() if f == 1]:
-            cleaned_obj = prune_obj(
-                obj=cleaned_obj,
-                on_keys=clean_keys,
-                for_values=orphaned_values,
-                ignore_paths=ignore_paths,
-            )
-        freq_after = get_substr_frequency(
-            string=json.dumps(cleaned_obj),
-            substrings=matches,
+    # membership is tested for every visited key/value: use hashed lookups
+    search_keys = frozenset(search_keys)
+    clean_keys = frozenset(clean_keys)
+    ignore_paths = frozenset(ignore_paths or ())
+
+    # index `obj` once and determine all items to be removed from the index alone,
+    # instead of re-traversing the whole object for each round of orphaned values
+    index = _index_obj(obj, search_keys, clean_keys, ignore_paths)
+    if index is None:
+        # shared containers would be counted per occurrence, but dropped only once
+        return _clean_obj_in_rounds(obj, search_keys, clean_keys, ignore_paths)
+    freq, items = index
+    dropped = set()  # ids of all containers within removed items
+    pruned_values = set()
+
+    orphaned_values = frozenset(k for k, f in freq.items() if f == 1)
+    while orphaned_values:
+        removed = collections.Counter()
+        for value in orphaned_values:
+            for item in items.pop(value, ()):
+                _drop_item(item, search_keys, removed, dropped)
+        pruned_values.update(orphaned_values)
+        freq.subtract(removed)
+        # items with previously orphaned values are gone by now: only values that
+        # lost references in this round may have become orphaned
+        orphaned_values = frozenset(k for k in removed if freq[k] == 1)
+
+    if not pruned_values:
+        return obj
+    # a single pass removes all items for any of the values orphaned in any round
+    if processes and _CONTAINER_TYPES[type(obj)] is dict:
+        return _prune_top_level_items(
+            obj, clean_keys, pruned_values, ignore_paths, processes
         )
-        if summed_frequencies(freq_after) == summed_frequencies(freq_before):
-            break
+    return prune_obj(
+        obj=obj,
+        on_keys=clean_keys,
+        for_values=pruned_values,
+        ignore_paths=ignore_paths,
+    )
 
-    return cleaned_obj
+
+def _positive_int(value: str) -> int:
+    """Convert command line argument `value` to an integer greater than zero."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
 
 
 if __name__ == "__main__":
@@ -245,6 +660,14 @@ if __name__ == "__main__":
         default=DEFAULT_IGNORED_PATHS,
         help="paths in which items will never be removed",
     )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        action="store",
+        type=_positive_int,
+        default=None,
+        help="number of processes among which top-level items are distributed",
+    )
     args = parser.parse_args()
 
     nested_obj = get_ordered_dict_from_file(
@@ -255,6 +678,7 @@ if __name__ == "__main__":
         search_keys=args.search_in,
         clean_keys=args.target_keys,
         ignore_paths=args.ignore_paths,
+        processes=args.processes,
     )
     write_dict_to_json(
         dict_=cleaned,
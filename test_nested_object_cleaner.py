@@ -0,0 +1,112 @@
+"""Tests for nested_object_cleaner."""
+
+import json
+import random
+import unittest
+
+import nested_object_cleaner as noc
+
+SEARCH_AND_CLEAN_KEYS = [
+    (("name", "fromDict", "sourceName"), ("name",)),
+    (("name", "fromDict"), ("fromDict",)),
+    (("fromDict",), ("name", "sourceName")),
+    (("name", "fromDict", "sourceName"), ("name", "sourceName")),
+]
+IGNORE_PATHS = [(), ("a",), ("b.c",), ("a.b", "c")]
+NAMES = [f"x{i:02d}" for i in range(40)]
+
+
+def random_obj(rng, shared=None, depth=0):
+    """Generate a nested object whose items refer to each other by name.
+
+    If `shared` is a list, already generated containers are collected in it and
+    randomly reused, so that they occur in several places of the object.
+    """
+    if depth > 4 or rng.random() < 0.2:
+        return rng.choice([0, 5, "", "plain", None, True, [], {}])
+    if shared and rng.random() < 0.15:
+        return rng.choice(shared)
+    if rng.random() < 0.5:
+        node = [random_obj(rng, shared, depth + 1) for _ in range(rng.randint(0, 4))]
+    else:
+        node = {}
+        for key, chance in (("name", 0.6), ("fromDict", 0.4), ("sourceName", 0.2)):
+            if rng.random() < chance:
+                node[key] = rng.choice(NAMES)
+        for key in rng.sample(["a", "b", "c", "d"], rng.randint(0, 3)):
+            node[key] = random_obj(rng, shared, depth + 1)
+    if shared is not None:
+        shared.append(node)
+    return node
+
+
+class CleanObjTest(unittest.TestCase):
+    def test_index_matches_rounds(self):
+        for seed in range(1000):
+            rng = random.Random(seed)
+            obj = {key: random_obj(rng) for key in "abcd"}
+            search_keys, clean_keys = SEARCH_AND_CLEAN_KEYS[seed % 4]
+            ignore_paths = rng.choice(IGNORE_PATHS)
+            snapshot = json.dumps(obj)
+            with self.subTest(seed=seed):
+                expected = noc._clean_obj_in_rounds(
+                    obj,
+                    frozenset(search_keys),
+                    frozenset(clean_keys),
+                    frozenset(ignore_paths),
+                )
+                cleaned = noc.clean_obj(obj, search_keys, clean_keys, ignore_paths)
+                self.assertEqual(cleaned, expected)
+                self.assertEqual(json.dumps(obj), snapshot)
+
+    def test_processes_match_single_process(self):
+        for seed in range(50):
+            rng = random.Random(seed)
+            obj = {key: random_obj(rng) for key in "abcd"}
+            search_keys, clean_keys = SEARCH_AND_CLEAN_KEYS[seed % 4]
+            ignore_paths = rng.choice(IGNORE_PATHS)
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    noc.clean_obj(
+                        obj, search_keys, clean_keys, ignore_paths, processes=2
+                    ),
+                    noc.clean_obj(obj, search_keys, clean_keys, ignore_paths),
+                )
+
+    def test_shared_containers(self):
+        for seed in range(500):
+            rng = random.Random(seed)
+            obj = {key: random_obj(rng, shared=[]) for key in "abcd"}
+            search_keys, clean_keys = SEARCH_AND_CLEAN_KEYS[seed % 2]
+            ignore_paths = rng.choice(IGNORE_PATHS)
+            as_tree = json.loads(json.dumps(obj))  # same content, nothing shared
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    noc.clean_obj(obj, search_keys, clean_keys, ignore_paths),
+                    noc.clean_obj(as_tree, search_keys, clean_keys, ignore_paths),
+                )
+
+    def test_circular_reference(self):
+        item = {"name": "a", "sub": []}
+        item["sub"].append(item)
+        for ignore_paths in ((), ("top.sub",)):
+            with self.assertRaisesRegex(ValueError, "circular reference"):
+                noc.clean_obj({"top": item}, ("name",), ("name",), ignore_paths)
+
+    def test_container_values_of_clean_keys(self):
+        obj = {"a": {"fromDict": "x"}, "b": {"name": ["x"]}, "c": {"name": "x"}}
+        self.assertEqual(
+            noc.clean_obj(obj, ("fromDict",), ("name",)),
+            {"a": {"fromDict": "x"}, "b": {"name": ["x"]}},
+        )
+
+    def test_ignored_path_below_empty_key(self):
+        obj = {"": {"x": {"name": "a"}, "y": {"name": "b"}}}
+        self.assertEqual(
+            noc.clean_obj(obj, ("name",), ("name",), (".x",)),
+            {"": {"x": {"name": "a"}}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()